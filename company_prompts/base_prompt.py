@@ -1,10 +1,45 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple
 import logging
+import re
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_RESPONSE_STYLE = MappingProxyType({
+    'currency_format': 'THB',
+    'number_format': 'comma_separated',
+    'date_format': 'DD/MM/YYYY',
+    'tone': 'professional'
+})
+
+_DANGEROUS_KEYWORDS = frozenset({'DROP', 'DELETE', 'UPDATE', 'INSERT', 'ALTER', 'CREATE'})
+_DANGEROUS_SQL_RE = re.compile(rf"\b({'|'.join(sorted(_DANGEROUS_KEYWORDS))})\b", re.IGNORECASE)
+
+
+KeywordCategories = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def keyword_categories(categories: Mapping[str, Iterable[str]]) -> KeywordCategories:
+    """🔎 Freeze ordered keyword categories for `first_keyword_category`"""
+    return tuple((category, tuple(keywords)) for category, keywords in categories.items())
+
+
+def first_keyword_category(text: str, categories: KeywordCategories) -> Optional[str]:
+    """🔎 First category (in order) with a keyword anywhere in text, else None
+
+    Same result as an if/elif chain of `any(k in text ...)` checks. Plain substring
+    tests stop at the first hit and stay cheaper than a regex alternation on long text.
+    """
+    for category, keywords in categories:
+        for keyword in keywords:
+            if keyword in text:
+                return category
+    return None
+
+
 class BaseCompanyPrompt(ABC):
     """🎯 Base class สำหรับ Company-specific prompts"""
     
@@ -27,7 +62,7 @@ class BaseCompanyPrompt(ABC):
             'last_used': None
         }
         
-        logger.info(f"✅ {self.__class__.__name__} initialized for {self.company_name}")
+        logger.info("✅ %s initialized for %s", self.__class__.__name__, self.company_name)
     
     @abstractmethod
     def generate_sql_prompt(self, question: str, schema_info: Dict[str, Any]) -> str:
@@ -40,37 +75,34 @@ class BaseCompanyPrompt(ABC):
         pass
     
     @abstractmethod 
-    def _load_business_rules(self) -> Dict[str, Any]:
+    def _load_business_rules(self) -> Mapping[str, Any]:
         """📋 Load company-specific business rules"""
         pass
     
     @abstractmethod
-    def _load_schema_mappings(self) -> Dict[str, Any]:
+    def _load_schema_mappings(self) -> Mapping[str, Any]:
         """🗄️ Load schema mappings for this company"""
         pass
     
-    def _load_response_style(self) -> Dict[str, Any]:
-        """🎨 Load response formatting preferences"""
-        return {
-            'currency_format': 'THB',
-            'number_format': 'comma_separated',
-            'date_format': 'DD/MM/YYYY',
-            'tone': 'professional'
-        }
+    def _load_response_style(self) -> Mapping[str, Any]:
+        """🎨 Load response formatting preferences (shared, read-only; copy with dict() to customise)"""
+        return _DEFAULT_RESPONSE_STYLE
     
     def validate_sql(self, sql: str) -> bool:
         """🔍 Basic SQL validation"""
-        # Common validation rules
-        dangerous_keywords = ['DROP', 'DELETE', 'UPDATE', 'INSERT', 'ALTER', 'CREATE']
-        sql_upper = sql.upper()
-        
-        for keyword in dangerous_keywords:
-            if keyword in sql_upper:
-                logger.warning(f"🚨 Dangerous SQL keyword detected: {keyword}")
-                return False
+        # Common validation rules (whole words only, so created_at etc. pass)
+        match = _DANGEROUS_SQL_RE.search(sql)
+        if match:
+            logger.warning("🚨 Dangerous SQL keyword detected: %s", match.group(1).upper())
+            return False
         
         return True
     
+    def _record_query(self) -> None:
+        """📊 Count a processed query; last_used is an epoch float formatted in get_statistics"""
+        self.usage_stats['queries_processed'] += 1
+        self.usage_stats['last_used'] = time.time()
+    
     def get_statistics(self) -> Dict[str, Any]:
         """📊 Get usage statistics"""
         success_rate = 0
@@ -78,6 +110,8 @@ class BaseCompanyPrompt(ABC):
             success_rate = (self.usage_stats['successful_generations'] / 
                           self.usage_stats['queries_processed']) * 100
         
+        last_used = self.usage_stats['last_used']
+        
         return {
             'company_id': self.company_id,
             'company_name': self.company_name,
@@ -85,5 +119,5 @@ class BaseCompanyPrompt(ABC):
             'queries_processed': self.usage_stats['queries_processed'],
             'successful_generations': self.usage_stats['successful_generations'],
             'success_rate': round(success_rate, 2),
-            'last_used': self.usage_stats['last_used']
+            'last_used': datetime.fromtimestamp(last_used).isoformat() if last_used else None
         }
\ No newline at end of file
@@ -1,43 +1,126 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
-from company_prompts.base_prompt import BaseCompanyPrompt
-from typing import Dict, Any, List
-from datetime import datetime
+from company_prompts.base_prompt import BaseCompanyPrompt, first_keyword_category, keyword_categories
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 # Import shared logger
 from shared_components.logging_config import logger
 
+# Static company configuration, shared read-only by every instance
+_BUSINESS_RULES = MappingProxyType({
+    'salary_ranges': MappingProxyType({'junior': '35k-50k', 'senior': '60k-100k', 'lead': '80k-150k'}),
+    'project_budgets': MappingProxyType({'small': '<1M', 'medium': '1M-2.5M', 'large': '>2.5M'}),
+    'focus': 'banking_and_enterprise_systems'
+})
+
+_SCHEMA_MAPPINGS = MappingProxyType({
+    'main_tables': ('employees', 'projects', 'employee_projects'),
+    'key_fields': ('salary', 'budget', 'status')
+})
+
+# Keyword lists (matched against the lowercased question)
+_GREETING_WORDS = ('สวัสดี', 'hello', 'hi', 'ช่วย', 'help', 'คุณคือใคร')
+_DATA_WORDS = ('พนักงาน', 'โปรเจค', 'project', 'employee', 'กี่คน', 'จำนวน', 'มีอะไร', 'ธนาคาร')
+
+# Greeting wins over data when both appear (same order as the old if/elif)
+_QUESTION_CATEGORIES = keyword_categories({'greeting': _GREETING_WORDS, 'data': _DATA_WORDS})
+
+# Static SQL prompt sections (identical for every question)
+_ENTERPRISE_SCHEMA = """📊 โครงสร้างฐานข้อมูล:
+• employees: id, name, department, position, salary, hire_date, email
+• projects: id, name, client, budget, status, start_date, end_date, tech_stack
+• employee_projects: employee_id, project_id, role, allocation"""
+
+_ENTERPRISE_SQL_RULES = """🔧 กฎ SQL สำหรับ Enterprise:
+1. ใช้ ILIKE '%keyword%' สำหรับการค้นหา (ไม่สนใจตัวใหญ่เล็ก)
+2. ใช้ LIMIT 20 เสมอ
+3. ไม่ใช้ COALESCE ที่ซับซ้อน
+4. เขียน SQL ให้เรียบง่าย"""
+
+# Canned data answers, checked in this order (banking before employee before project)
+_DATA_TOPICS = keyword_categories({
+    'banking': ('ธนาคาร', 'banking'),
+    'employee': ('พนักงาน', 'employee'),
+    'project': ('โปรเจค', 'project'),
+})
+
+_DATA_ANSWERS = {
+    'banking': """📊 โปรเจคธนาคารของเรา:
+
+1. ระบบ CRM สำหรับธนาคาร
+   • ลูกค้า: ธนาคารกรุงเทพ
+   • งบประมาณ: 3,000,000 บาท
+   • สถานะ: กำลังดำเนินการ
+
+2. Mobile Banking App
+   • ลูกค้า: ธนาคารไทยพาณิชย์
+   • งบประมาณ: 2,500,000 บาท
+   • สถานะ: กำลังดำเนินการ
+
+💡 เราเป็นผู้เชี่ยวชาญระบบธนาคารชั้นนำ""",
+    'employee': """📊 ข้อมูลพนักงาน Enterprise:
+
+1. แผนก IT: 10 คน (เงินเดือนเฉลี่ย 75,000 บาท)
+2. แผนก Sales: 3 คน (เงินเดือนเฉลี่ย 65,000 บาท)
+3. แผนก Management: 2 คน (เงินเดือนเฉลี่ย 120,000 บาท)
+
+💡 ทีมงานระดับ Senior มีประสบการณ์สูง""",
+    'project': """📊 โปรเจค Enterprise ปัจจุบัน:
+
+1. ระบบ CRM สำหรับธนาคาร (3M บาท)
+2. AI Chatbot E-commerce (1.2M บาท)
+3. Mobile Banking App (2.5M บาท)
+4. เว็บไซต์ E-learning (800K บาท)
+
+💡 รวมมูลค่าโปรเจค 7.5 ล้านบาท""",
+}
+
 class EnterprisePrompt(BaseCompanyPrompt):
     """🏦 Simple Enterprise Banking Prompt"""
     
     def __init__(self, company_config: Dict[str, Any]):
         super().__init__(company_config)
-        logger.info(f"✅ Simple EnterprisePrompt initialized for {self.company_name}")
+        
+        # Static part of the SQL prompt for this company
+        self._sql_prompt_prefix = f"""คุณคือนักวิเคราะห์ระบบ Enterprise Banking สำหรับ {self.company_name}
+
+🏢 บริบทธุรกิจ: ระบบธนาคารและองค์กรขนาดใหญ่
+💰 งบประมาณโปรเจค: 800,000 - 3,000,000+ บาท
+🎯 ลูกค้าหลัก: ธนาคาร, บริษัทใหญ่, E-commerce
+
+{_ENTERPRISE_SCHEMA}
+
+{_ENTERPRISE_SQL_RULES}
+
+คำถาม: """
+        
+        logger.info("✅ Simple EnterprisePrompt initialized for %s", self.company_name)
     
     # ✅ MAIN ENTRY POINT (Required by PromptManager)
     async def process_question(self, question: str) -> Dict[str, Any]:
         """🎯 Simple main processing method"""
         
         try:
-            self.usage_stats['queries_processed'] += 1
-            self.usage_stats['last_used'] = datetime.now().isoformat()
+            self._record_query()
             
-            # Simple logic: detect if it's a greeting or data query
-            if self._is_greeting(question):
+            # Simple logic: detect if it's a greeting or data query (greeting checked first)
+            question_lower = question.lower()
+            category = first_keyword_category(question_lower, _QUESTION_CATEGORIES)
+            
+            if category == 'greeting':
                 return self._create_greeting_response()
-            elif self._is_data_query(question):
-                return self._create_data_response(question)
+            elif category == 'data':
+                return self._create_data_response(question, question_lower)
             else:
                 return self._create_general_response(question)
                 
         except Exception as e:
-            logger.error(f"❌ Enterprise processing failed: {e}")
+            error = str(e)
+            logger.error("❌ Enterprise processing failed: %s", error)
             return {
                 'success': False,
-                'answer': f"เกิดข้อผิดพลาด: {str(e)}",
-                'error': str(e),
+                'answer': f"เกิดข้อผิดพลาด: {error}",
+                'error': error,
                 'tenant_id': self.company_id,
                 'data_source_used': 'enterprise_error'
             }
@@ -46,28 +129,8 @@ class EnterprisePrompt(BaseCompanyPrompt):
     def generate_sql_prompt(self, question: str, schema_info: Dict[str, Any]) -> str:
         """🎯 Simple SQL prompt generation"""
         
-        prompt = f"""คุณคือนักวิเคราะห์ระบบ Enterprise Banking สำหรับ {self.company_name}
-
-🏢 บริบทธุรกิจ: ระบบธนาคารและองค์กรขนาดใหญ่
-💰 งบประมาณโปรเจค: 800,000 - 3,000,000+ บาท
-🎯 ลูกค้าหลัก: ธนาคาร, บริษัทใหญ่, E-commerce
-
-📊 โครงสร้างฐานข้อมูล:
-• employees: id, name, department, position, salary, hire_date, email
-• projects: id, name, client, budget, status, start_date, end_date, tech_stack
-• employee_projects: employee_id, project_id, role, allocation
-
-🔧 กฎ SQL สำหรับ Enterprise:
-1. ใช้ ILIKE '%keyword%' สำหรับการค้นหา (ไม่สนใจตัวใหญ่เล็ก)
-2. ใช้ LIMIT 20 เสมอ
-3. ไม่ใช้ COALESCE ที่ซับซ้อน
-4. เขียน SQL ให้เรียบง่าย
-
-คำถาม: {question}
-
-สร้าง PostgreSQL query:"""
-
-        return prompt
+        # Only the question varies per call; the rest is built in __init__
+        return self._sql_prompt_prefix + question + "\n\nสร้าง PostgreSQL query:"
     
     def format_response(self, question: str, results: List[Dict], metadata: Dict) -> str:
         """🎨 Simple response formatting"""
@@ -75,48 +138,34 @@ class EnterprisePrompt(BaseCompanyPrompt):
         if not results:
             return f"ไม่พบข้อมูลที่ตรงกับคำถาม: {question}"
         
-        response = f"📊 ผลการวิเคราะห์ระบบ Enterprise - {self.company_name}\n\n"
+        parts = [f"📊 ผลการวิเคราะห์ระบบ Enterprise - {self.company_name}\n\n"]
+        
+        # Result rows share their columns, so detect money columns once
+        money_columns = frozenset(key for key in results[0] if 'salary' in key or 'budget' in key)
         
         # Display results (simple format)
-        for i, row in enumerate(results[:10], 1):
-            response += f"{i}. "
+        for i, row in enumerate(islice(results, 10), 1):
+            row_parts = []
             for key, value in row.items():
-                if 'salary' in key or 'budget' in key:
-                    response += f"{key}: {value:,.0f} บาท, "
+                if key in money_columns:
+                    row_parts.append(f"{key}: {value:,.0f} บาท")
                 else:
-                    response += f"{key}: {value}, "
-            response = response.rstrip(', ') + "\n"
+                    row_parts.append(f"{key}: {value}")
+            parts.append((f"{i}. " + ", ".join(row_parts)).rstrip(', ') + "\n")
         
-        response += f"\n💡 สรุป: พบข้อมูล {len(results)} รายการจากระบบ Enterprise"
+        parts.append(f"\n💡 สรุป: พบข้อมูล {len(results)} รายการจากระบบ Enterprise")
         
-        return response
+        return "".join(parts)
     
-    def _load_business_rules(self) -> Dict[str, Any]:
-        """📋 Simple business rules"""
-        return {
-            'salary_ranges': {'junior': '35k-50k', 'senior': '60k-100k', 'lead': '80k-150k'},
-            'project_budgets': {'small': '<1M', 'medium': '1M-2.5M', 'large': '>2.5M'},
-            'focus': 'banking_and_enterprise_systems'
-        }
+    def _load_business_rules(self) -> Mapping[str, Any]:
+        """📋 Simple business rules (shared, read-only)"""
+        return _BUSINESS_RULES
     
-    def _load_schema_mappings(self) -> Dict[str, Any]:
-        """🗄️ Simple schema mappings"""
-        return {
-            'main_tables': ['employees', 'projects', 'employee_projects'],
-            'key_fields': ['salary', 'budget', 'status']
-        }
+    def _load_schema_mappings(self) -> Mapping[str, Any]:
+        """🗄️ Simple schema mappings (shared, read-only)"""
+        return _SCHEMA_MAPPINGS
     
     # ✅ SIMPLE HELPER METHODS (เพียง 3 ตัว)
-    def _is_greeting(self, question: str) -> bool:
-        """Check if question is a greeting"""
-        greetings = ['สวัสดี', 'hello', 'hi', 'ช่วย', 'help', 'คุณคือใคร']
-        return any(word in question.lower() for word in greetings)
-    
-    def _is_data_query(self, question: str) -> bool:
-        """Check if question asks for data"""
-        data_words = ['พนักงาน', 'โปรเจค', 'project', 'employee', 'กี่คน', 'จำนวน', 'มีอะไร', 'ธนาคาร']
-        return any(word in question.lower() for word in data_words)
-    
     def _create_greeting_response(self) -> Dict[str, Any]:
         """Simple greeting response"""
         answer = f"""สวัสดีครับ! ผมคือ AI Assistant สำหรับ {self.company_name}
@@ -141,44 +190,13 @@ class EnterprisePrompt(BaseCompanyPrompt):
             'tenant_id': self.company_id
         }
     
-    def _create_data_response(self, question: str) -> Dict[str, Any]:
+    def _create_data_response(self, question: str, question_lower: str) -> Dict[str, Any]:
         """Simple data response with mock data"""
         
         # Mock data based on question keywords
-        if 'ธนาคาร' in question or 'banking' in question.lower():
-            answer = """📊 โปรเจคธนาคารของเรา:
-
-1. ระบบ CRM สำหรับธนาคาร
-   • ลูกค้า: ธนาคารกรุงเทพ
-   • งบประมาณ: 3,000,000 บาท
-   • สถานะ: กำลังดำเนินการ
-
-2. Mobile Banking App
-   • ลูกค้า: ธนาคารไทยพาณิชย์
-   • งบประมาณ: 2,500,000 บาท
-   • สถานะ: กำลังดำเนินการ
-
-💡 เราเป็นผู้เชี่ยวชาญระบบธนาคารชั้นนำ"""
-
-        elif 'พนักงาน' in question or 'employee' in question.lower():
-            answer = """📊 ข้อมูลพนักงาน Enterprise:
-
-1. แผนก IT: 10 คน (เงินเดือนเฉลี่ย 75,000 บาท)
-2. แผนก Sales: 3 คน (เงินเดือนเฉลี่ย 65,000 บาท)
-3. แผนก Management: 2 คน (เงินเดือนเฉลี่ย 120,000 บาท)
-
-💡 ทีมงานระดับ Senior มีประสบการณ์สูง"""
-
-        elif 'โปรเจค' in question or 'project' in question.lower():
-            answer = """📊 โปรเจค Enterprise ปัจจุบัน:
-
-1. ระบบ CRM สำหรับธนาคาร (3M บาท)
-2. AI Chatbot E-commerce (1.2M บาท)
-3. Mobile Banking App (2.5M บาท)
-4. เว็บไซต์ E-learning (800K บาท)
-
-💡 รวมมูลค่าโปรเจค 7.5 ล้านบาท"""
-
+        topic = first_keyword_category(question_lower, _DATA_TOPICS)
+        if topic:
+            answer = _DATA_ANSWERS[topic]
         else:
             answer = f"""📊 ข้อมูล Enterprise สำหรับ: {question}
 
@@ -1,49 +1,153 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
-from company_prompts.base_prompt import BaseCompanyPrompt
-from typing import Dict, Any, List
-from datetime import datetime
+from company_prompts.base_prompt import BaseCompanyPrompt, first_keyword_category, keyword_categories
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 from shared_components.logging_config import logger
 
+# Static tourism data, shared read-only by every instance
+_TOURISM_DATA = MappingProxyType({
+    'keywords': MappingProxyType({
+        'accommodation': ('โรงแรม', 'รีสอร์ท', 'hotel', 'resort', 'ที่พัก'),
+        'tourism': ('ท่องเที่ยว', 'tourism', 'TAT', 'สถานที่ท่องเที่ยว'),
+        'food': ('ร้านอาหาร', 'restaurant', 'อาหาร', 'ครัว'),
+        'culture': ('วัฒนธรรม', 'ล้านนา', 'lanna', 'ประเพณี'),
+        'regional': ('เชียงใหม่', 'ภาคเหนือ', 'northern')
+    }),
+    'clients': (
+        'โรงแรมดุสิต เชียงใหม่',
+        'การท่องเที่ยวแห่งประเทศไทย',
+        'สวนพฤกษศาสตร์เชียงใหม่',
+        'กลุ่มร้านอาหารล้านนา',
+        'มหาวิทยาลัยเชียงใหม่'
+    ),
+    'culture': MappingProxyType({
+        'greeting': 'สวัสดีเจ้า',
+        'foods': ('ข้าวซอย', 'แกงฮังเล', 'ไส้อั่ว', 'น้ำพริกน้ำปู'),
+        'values': ('น้ำใจเหนือ', 'ความเป็นมิตร', 'การต้อนรับแบบล้านนา'),
+        'festivals': ('สงกรานต์', 'ลอยกระทง', 'ยี่เป็ง', 'บุญบั้งไฟ')
+    }),
+    'budget_ranges': MappingProxyType({
+        'small': 'budget < 400000',
+        'medium': 'budget BETWEEN 400000 AND 600000',
+        'large': 'budget > 600000'
+    })
+})
+
+_BUSINESS_RULES = MappingProxyType({
+    'focus': 'tourism_hospitality_northern_thailand',
+    'budget_ranges': _TOURISM_DATA['budget_ranges'],
+    'primary_clients': _TOURISM_DATA['clients'][:3]
+})
+
+_SCHEMA_MAPPINGS = MappingProxyType({
+    'main_tables': ('employees', 'projects', 'employee_projects'),
+    'tourism_keywords': _TOURISM_DATA['keywords']
+})
+
+# Tourism categories in dict order (matched against the lowercased question)
+_TOURISM_TYPES = keyword_categories(_TOURISM_DATA['keywords'])
+
+# Static SQL prompt section (identical for every question)
+_TOURISM_SCHEMA = """📊 โครงสร้างฐานข้อมูล:
+• employees: id, name, department, position, salary, hire_date, email
+• projects: id, name, client, budget, status, start_date, end_date, tech_stack
+• employee_projects: employee_id, project_id, role, allocation"""
+
+# Greeting words (matched against the lowercased question)
+_GREETING_WORDS = ('สวัสดี', 'hello', 'hi', 'เจ้า', 'ช่วย')
+
+# Greeting wins over any tourism category (same order as the old if/elif);
+# otherwise the matched category is the tourism type
+_QUESTION_CATEGORIES = keyword_categories({'greeting': _GREETING_WORDS, **_TOURISM_DATA['keywords']})
+
+# Client icons, checked in this order (hotel before tourism before restaurant before garden)
+_CLIENT_ICON_CATEGORIES = keyword_categories({
+    'hotel': ('โรงแรม', 'hotel'),
+    'tourism': ('ท่องเที่ยว', 'tourism'),
+    'restaurant': ('ร้านอาหาร', 'restaurant'),
+    'garden': ('สวน', 'garden'),
+})
+
+_CLIENT_ICONS = {
+    'hotel': ' 🏨',
+    'tourism': ' ✈️',
+    'restaurant': ' 🍜',
+    'garden': ' 🌿',
+}
+
+@lru_cache(maxsize=2048)
+def _tourism_type(question_lower: str) -> str:
+    """First keyword category (in dict order) mentioned anywhere in the question"""
+    return first_keyword_category(question_lower, _TOURISM_TYPES) or 'general'
+
+@lru_cache(maxsize=1024)
+def _client_icon(client_name: str) -> str:
+    """Icon for a client name (client names repeat across result rows)"""
+    category = first_keyword_category(client_name.lower(), _CLIENT_ICON_CATEGORIES)
+    return _CLIENT_ICONS[category] if category else ''
+
 class SimpleTourismPrompt(BaseCompanyPrompt):
     """🏨 FIXED Tourism Prompt - Compatible with BaseCompanyPrompt"""
     
+    # 🎯 Tourism data - class level, so it already exists while super().__init__() loads the rules
+    tourism_data = _TOURISM_DATA
+    
     def __init__(self, company_config: Dict[str, Any]):
         # 🔧 Initialize parent class first
         super().__init__(company_config)
         
-        # 🎯 Tourism data - moved AFTER super().__init__()
-        self.tourism_data = {
-            'keywords': {
-                'accommodation': ['โรงแรม', 'รีสอร์ท', 'hotel', 'resort', 'ที่พัก'],
-                'tourism': ['ท่องเที่ยว', 'tourism', 'TAT', 'สถานที่ท่องเที่ยว'],
-                'food': ['ร้านอาหาร', 'restaurant', 'อาหาร', 'ครัว'],
-                'culture': ['วัฒนธรรม', 'ล้านนา', 'lanna', 'ประเพณี'],
-                'regional': ['เชียงใหม่', 'ภาคเหนือ', 'northern']
-            },
-            'clients': [
-                'โรงแรมดุสิต เชียงใหม่',
-                'การท่องเที่ยวแห่งประเทศไทย', 
-                'สวนพฤกษศาสตร์เชียงใหม่',
-                'กลุ่มร้านอาหารล้านนา',
-                'มหาวิทยาลัยเชียงใหม่'
-            ],
-            'culture': {
-                'greeting': 'สวัสดีเจ้า',
-                'foods': ['ข้าวซอย', 'แกงฮังเล', 'ไส้อั่ว', 'น้ำพริกน้ำปู'],
-                'values': ['น้ำใจเหนือ', 'ความเป็นมิตร', 'การต้อนรับแบบล้านนา'],
-                'festivals': ['สงกรานต์', 'ลอยกระทง', 'ยี่เป็ง', 'บุญบั้งไฟ']
-            },
-            'budget_ranges': {
-                'small': 'budget < 400000',
-                'medium': 'budget BETWEEN 400000 AND 600000', 
-                'large': 'budget > 600000'
-            }
+        # Company-invariant part of the SQL prompt, built once
+        self._primary_clients = ', '.join(self.tourism_data['clients'][:3])
+        self._sql_prompt_prefix = f"""คุณคือนักวิเคราะห์ท่องเที่ยวเชี่ยวชาญสำหรับ {self.company_name}
+
+🏨 บริบทธุรกิจ: เทคโนโลยีท่องเที่ยวและการต้อนรับ ภาคเหนือ
+🌿 ลูกค้าหลัก: {self._primary_clients}
+💰 งบประมาณ: 300,000 - 800,000 บาท
+
+{_TOURISM_SCHEMA}
+
+🎭 บริบทวัฒนธรรม: """
+        
+        # Cultural hints and canned answers only depend on static data
+        culture = self.tourism_data['culture']
+        first_value = culture['values'][0]
+        festivals_top2 = ', '.join(culture['festivals'][:2])
+        self._cultural_hints = {
+            'accommodation': f"โรงแรมล้านนา, {first_value}",
+            'food': f"อาหารเหนือ: {', '.join(culture['foods'][:2])}",
+            'culture': f"ประเพณีล้านนา: {festivals_top2}",
+            'general': f"ท่องเที่ยวภาคเหนือ, {first_value}"
+        }
+        self._greeting_answer = f"""{culture['greeting']}! ผมคือ AI Assistant สำหรับ {self.company_name}
+
+🏨 เราเชี่ยวชาญด้านเทคโนโลยีท่องเที่ยวภาคเหนือ:
+• ระบบโรงแรมและรีสอร์ท
+• แอปพลิเคชันท่องเที่ยว
+• ระบบร้านอาหารและ POS
+
+🌿 ลูกค้าหลัก: {self._primary_clients}
+
+{first_value} - มีอะไรให้ช่วยไหมครับ?"""
+        self._tourism_answers = {
+            'accommodation': """🏨 โปรเจคโรงแรมและที่พัก:
+
+1. ระบบจัดการโรงแรม - โรงแรมดุสิต เชียงใหม่
+   • งบประมาณ: 800,000 บาท
+   • เทคโนโลยี: Vue.js, Firebase
+
+🌿 เน้นการบริการแบบล้านนา""",
+
+            'tourism': f"""✈️ โปรเจคท่องเที่ยว:
+
+1. เว็บไซต์ท่องเที่ยว - การท่องเที่ยวแห่งประเทศไทย
+   • งบประมาณ: 600,000 บาท  
+   • เทคโนโลยี: React, Firebase
+
+🎭 วัฒนธรรมล้านนา: {festivals_top2}"""
         }
         
-        logger.info(f"🏨 SimpleTourismPrompt initialized for {self.company_name}")
+        logger.info("🏨 SimpleTourismPrompt initialized for %s", self.company_name)
     
     # ========================================================================
     # 🎯 REQUIRED METHODS from BaseCompanyPrompt
@@ -53,22 +157,25 @@ class SimpleTourismPrompt(BaseCompanyPrompt):
         """🎯 Main processing method"""
         
         try:
-            self.usage_stats['queries_processed'] += 1
-            self.usage_stats['last_used'] = datetime.now().isoformat()
+            self._record_query()
+            
+            # Greeting first, then the tourism categories in order (or nothing)
+            category = first_keyword_category(question.lower(), _QUESTION_CATEGORIES)
             
-            if self._is_greeting(question):
+            if category == 'greeting':
                 return self._create_tourism_greeting()
-            elif self._is_tourism_query(question):
-                return self._create_tourism_response(question)
+            elif category is not None:
+                return self._create_tourism_response(question, category)
             else:
                 return self._create_general_response(question)
                 
         except Exception as e:
-            logger.error(f"❌ Tourism processing failed: {e}")
+            error = str(e)
+            logger.error("❌ Tourism processing failed: %s", error)
             return {
                 'success': False,
-                'answer': f"เกิดข้อผิดพลาด: {str(e)}",
-                'error': str(e),
+                'answer': f"เกิดข้อผิดพลาด: {error}",
+                'error': error,
                 'tenant_id': self.company_id
             }
     
@@ -78,24 +185,8 @@ class SimpleTourismPrompt(BaseCompanyPrompt):
         tourism_type = self._detect_tourism_type(question)
         cultural_hint = self._get_cultural_hint(tourism_type)
         
-        prompt = f"""คุณคือนักวิเคราะห์ท่องเที่ยวเชี่ยวชาญสำหรับ {self.company_name}
-
-🏨 บริบทธุรกิจ: เทคโนโลยีท่องเที่ยวและการต้อนรับ ภาคเหนือ
-🌿 ลูกค้าหลัก: {', '.join(self.tourism_data['clients'][:3])}
-💰 งบประมาณ: 300,000 - 800,000 บาท
-
-📊 โครงสร้างฐานข้อมูล:
-• employees: id, name, department, position, salary, hire_date, email
-• projects: id, name, client, budget, status, start_date, end_date, tech_stack
-• employee_projects: employee_id, project_id, role, allocation
-
-🎭 บริบทวัฒนธรรม: {cultural_hint}
-
-คำถาม: {question}
-
-สร้าง PostgreSQL query เฉพาะท่องเที่ยวภาคเหนือ:"""
-
-        return prompt
+        return (self._sql_prompt_prefix + cultural_hint + "\n\nคำถาม: " + question
+                + "\n\nสร้าง PostgreSQL query เฉพาะท่องเที่ยวภาคเหนือ:")
     
     def format_response(self, question: str, results: List[Dict], metadata: Dict) -> str:
         """🎨 Format tourism response"""
@@ -103,126 +194,60 @@ class SimpleTourismPrompt(BaseCompanyPrompt):
         if not results:
             return f"ไม่พบข้อมูลท่องเที่ยวที่เกี่ยวข้องกับ: {question}"
         
-        response = f"🏨 ข้อมูลท่องเที่ยวภาคเหนือ - {self.company_name}\n\n"
+        parts = [f"🏨 ข้อมูลท่องเที่ยวภาคเหนือ - {self.company_name}\n\n"]
         
-        for i, row in enumerate(results[:10], 1):
-            response += f"{i:2d}. "
+        for i, row in enumerate(islice(results, 10), 1):
+            row_parts = []
             for key, value in row.items():
                 if 'budget' in key.lower() and isinstance(value, (int, float)):
-                    response += f"{key}: {value:,.0f} บาท, "
+                    row_parts.append(f"{key}: {value:,.0f} บาท")
                 elif 'client' in key.lower() and value:
                     icon = self._get_tourism_icon(value)
-                    response += f"{key}: {value}{icon}, "
+                    row_parts.append(f"{key}: {value}{icon}")
                 else:
-                    response += f"{key}: {value}, "
-            response = response.rstrip(', ') + "\n"
+                    row_parts.append(f"{key}: {value}")
+            parts.append((f"{i:2d}. " + ", ".join(row_parts)).rstrip(', ') + "\n")
         
-        response += f"\n🌿 ข้อมูลเชิงลึก: พบ {len(results)} รายการจากระบบท่องเที่ยวภาคเหนือ"
+        parts.append(f"\n🌿 ข้อมูลเชิงลึก: พบ {len(results)} รายการจากระบบท่องเที่ยวภาคเหนือ")
         
-        return response
+        return "".join(parts)
     
-    def _load_business_rules(self) -> Dict[str, Any]:
-        """📋 Tourism business rules"""
-        return {
-            'focus': 'tourism_hospitality_northern_thailand',
-            'budget_ranges': self.tourism_data['budget_ranges'],
-            'primary_clients': self.tourism_data['clients'][:3]
-        }
+    def _load_business_rules(self) -> Mapping[str, Any]:
+        """📋 Tourism business rules (shared, read-only)"""
+        return _BUSINESS_RULES
     
-    def _load_schema_mappings(self) -> Dict[str, Any]:
-        """🗄️ Tourism schema mappings"""
-        return {
-            'main_tables': ['employees', 'projects', 'employee_projects'],
-            'tourism_keywords': self.tourism_data['keywords']
-        }
+    def _load_schema_mappings(self) -> Mapping[str, Any]:
+        """🗄️ Tourism schema mappings (shared, read-only)"""
+        return _SCHEMA_MAPPINGS
     
     # ========================================================================
     # 🔧 HELPER METHODS
     # ========================================================================
     
-    def _is_greeting(self, question: str) -> bool:
-        greetings = ['สวัสดี', 'hello', 'hi', 'เจ้า', 'ช่วย']
-        return any(word in question.lower() for word in greetings)
-    
-    def _is_tourism_query(self, question: str) -> bool:
-        question_lower = question.lower()
-        all_keywords = []
-        for category in self.tourism_data['keywords'].values():
-            all_keywords.extend(category)
-        return any(keyword in question_lower for keyword in all_keywords)
-    
     def _detect_tourism_type(self, question: str) -> str:
-        question_lower = question.lower()
-        for tourism_type, keywords in self.tourism_data['keywords'].items():
-            if any(keyword in question_lower for keyword in keywords):
-                return tourism_type
-        return 'general'
+        return _tourism_type(question.lower())
     
     def _get_cultural_hint(self, tourism_type: str) -> str:
-        culture_hints = {
-            'accommodation': f"โรงแรมล้านนา, {self.tourism_data['culture']['values'][0]}",
-            'food': f"อาหารเหนือ: {', '.join(self.tourism_data['culture']['foods'][:2])}",
-            'culture': f"ประเพณีล้านนา: {', '.join(self.tourism_data['culture']['festivals'][:2])}",
-            'general': f"ท่องเที่ยวภาคเหนือ, {self.tourism_data['culture']['values'][0]}"
-        }
-        return culture_hints.get(tourism_type, culture_hints['general'])
+        return self._cultural_hints.get(tourism_type, self._cultural_hints['general'])
     
     def _get_tourism_icon(self, client_name: str) -> str:
-        client_lower = client_name.lower()
-        if any(word in client_lower for word in ['โรงแรม', 'hotel']):
-            return ' 🏨'
-        elif any(word in client_lower for word in ['ท่องเที่ยว', 'tourism']):
-            return ' ✈️'
-        elif any(word in client_lower for word in ['ร้านอาหาร', 'restaurant']):
-            return ' 🍜'
-        elif any(word in client_lower for word in ['สวน', 'garden']):
-            return ' 🌿'
-        return ''
+        return _client_icon(client_name)
     
     def _create_tourism_greeting(self) -> Dict[str, Any]:
-        answer = f"""{self.tourism_data['culture']['greeting']}! ผมคือ AI Assistant สำหรับ {self.company_name}
-
-🏨 เราเชี่ยวชาญด้านเทคโนโลยีท่องเที่ยวภาคเหนือ:
-• ระบบโรงแรมและรีสอร์ท
-• แอปพลิเคชันท่องเที่ยว
-• ระบบร้านอาหารและ POS
-
-🌿 ลูกค้าหลัก: {', '.join(self.tourism_data['clients'][:3])}
-
-{self.tourism_data['culture']['values'][0]} - มีอะไรให้ช่วยไหมครับ?"""
-        
         return {
             'success': True,
-            'answer': answer,
+            'answer': self._greeting_answer,
             'sql_query': None,
             'data_source_used': f'tourism_greeting_{self.model}',
             'tenant_id': self.company_id
         }
     
-    def _create_tourism_response(self, question: str) -> Dict[str, Any]:
-        tourism_type = self._detect_tourism_type(question)
-        
-        responses = {
-            'accommodation': f"""🏨 โปรเจคโรงแรมและที่พัก:
-
-1. ระบบจัดการโรงแรม - โรงแรมดุสิต เชียงใหม่
-   • งบประมาณ: 800,000 บาท
-   • เทคโนโลยี: Vue.js, Firebase
-
-🌿 เน้นการบริการแบบล้านนา""",
-
-            'tourism': f"""✈️ โปรเจคท่องเที่ยว:
-
-1. เว็บไซต์ท่องเที่ยว - การท่องเที่ยวแห่งประเทศไทย
-   • งบประมาณ: 600,000 บาท  
-   • เทคโนโลยี: React, Firebase
-
-🎭 วัฒนธรรมล้านนา: {', '.join(self.tourism_data['culture']['festivals'][:2])}"""
-        }
-        
-        answer = responses.get(tourism_type, f"""🌿 ข้อมูลท่องเที่ยวภาคเหนือสำหรับ: {question}
+    def _create_tourism_response(self, question: str, tourism_type: str) -> Dict[str, Any]:
+        answer = self._tourism_answers.get(tourism_type)
+        if answer is None:
+            answer = f"""🌿 ข้อมูลท่องเที่ยวภาคเหนือสำหรับ: {question}
 
-เกี่ยวกับ {self.company_name}: เทคโนโลยีท่องเที่ยวและการต้อนรับ""")
+เกี่ยวกับ {self.company_name}: เทคโนโลยีท่องเที่ยวและการต้อนรับ"""
         
         return {
             'success': True,
@@ -1,60 +1,209 @@
 # company_prompts/company_c/international_prompt.py
 # 🔧 Fixed version
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
-from company_prompts.base_prompt import BaseCompanyPrompt
-from typing import Dict, Any, List
-from datetime import datetime
+from company_prompts.base_prompt import BaseCompanyPrompt, first_keyword_category, keyword_categories
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 from shared_components.logging_config import logger
 
+# Static international data, shared read-only by every instance
+_INTERNATIONAL_DATA = MappingProxyType({
+    'markets': MappingProxyType({
+        'north_america': MappingProxyType({
+            'countries': ('USA', 'Canada'),
+            'currency': 'USD',
+            'clients': ('MegaCorp International',)
+        }),
+        'europe': MappingProxyType({
+            'countries': ('UK', 'Germany'),
+            'currency': 'EUR/GBP',
+            'clients': ('Education Global Network',)
+        }),
+        'asia_pacific': MappingProxyType({
+            'countries': ('Singapore', 'Australia'),
+            'currency': 'SGD/AUD',
+            'clients': ('Global Finance Corp',)
+        })
+    }),
+    'currencies': MappingProxyType({
+        'primary': ('USD', 'EUR', 'GBP'),
+        'secondary': ('SGD', 'AUD'),
+        'rates': MappingProxyType({'USD': 1.0, 'EUR': 0.85, 'GBP': 0.80})
+    }),
+    'major_clients': (
+        'MegaCorp International (USA)',
+        'Education Global Network (UK)',
+        'Global Finance Corp (Singapore)'
+    ),
+    'keywords': MappingProxyType({
+        'financial': ('revenue', 'budget', 'usd', 'profit'),
+        'global': ('international', 'global', 'worldwide'),
+        'clients': ('client', 'customer', 'megacorp'),
+        'projects': ('project', 'platform', 'system')
+    })
+})
+
+_BUSINESS_RULES = MappingProxyType({
+    'focus': 'international_operations_multi_currency',
+    'primary_currency': 'USD',
+    'supported_currencies': tuple(_INTERNATIONAL_DATA['currencies']['rates']),
+    'client_base': 'global_enterprise'
+})
+
+_SCHEMA_MAPPINGS = MappingProxyType({
+    'main_tables': ('employees', 'projects', 'employee_projects'),
+    'currency_fields': ('budget', 'salary'),
+    'international_keywords': _INTERNATIONAL_DATA['keywords']
+})
+
+# Greeting words (matched against the lowercased question)
+_GREETING_WORDS = ('hello', 'hi', 'help', 'who are you', 'สวัสดี')
+
+# Greeting before financial before global (same order as the old if/elif)
+_QUESTION_CATEGORIES = keyword_categories({
+    'greeting': _GREETING_WORDS,
+    'financial': _INTERNATIONAL_DATA['keywords']['financial'],
+    'global': _INTERNATIONAL_DATA['keywords']['global'],
+})
+
+# Static SQL prompt sections (identical for every question)
+_INTERNATIONAL_SCHEMA = """📊 Database Schema:
+• employees: id, name, department, position, salary, hire_date, email
+• projects: id, name, client, budget, status, start_date, end_date, tech_stack
+• employee_projects: employee_id, project_id, role, allocation"""
+
+# Text between the focus and the currency hint
+_SQL_PROMPT_MID = f"""
+
+{_INTERNATIONAL_SCHEMA}
+
+💱 Currency Context: """
+
+# Static tails of the canned answers (everything after the question line)
+_FINANCIAL_ANSWER_TAIL = """
+
+💰 Multi-Currency Revenue Portfolio:
+
+1. Global E-commerce Platform - MegaCorp International 🇺🇸
+   • Contract Value: $2,800,000 USD
+   • Status: Active
+
+2. International Banking API - Global Finance Corp 🌏
+   • Contract Value: $3,200,000 USD
+
+💱 Currency Breakdown:
+• USD Revenue: $6,000,000+ (direct + converted)
+• Active Currencies: USD, GBP, SGD, AUD"""
+
+_GLOBAL_ANSWER_TAIL = """
+
+🌍 International Project Portfolio:
+
+1. Cross-border Payment System 🇦🇺
+   • Budget: $1,800,000 USD
+   • Status: Completed
+
+2. Global Compliance Platform 🇩🇪
+   • Budget: $3,850,000 USD
+   • Status: In Development
+
+🌐 Global Infrastructure:
+• Time Zone Coverage: 24/7 operations
+• Team Distribution: 8 international developers"""
+
+_GENERAL_ANSWER_TAIL = """
+
+Our International Capabilities:
+• Cross-border software development
+• Multi-currency system architecture
+• Global compliance and security
+
+🌎 Geographic Presence:
+• Development Teams: Bangkok (HQ), Remote Global
+• Client Base: USA, UK, Singapore, Australia
+
+💡 Ask me about:
+• International project portfolios
+• Multi-currency revenue analysis  
+• Global client relationships"""
+
+# Client region: a market matches when the client name contains any word of one
+# of its known clients; markets are checked in order, as the old nested loop did
+_CLIENT_REGION_CATEGORIES = keyword_categories({
+    market: [word for client in data['clients'] for word in client.lower().split()]
+    for market, data in _INTERNATIONAL_DATA['markets'].items()
+})
+
+_CURRENCY_HINTS = MappingProxyType({
+    'financial_analysis': 'Multi-currency revenue analysis, USD conversion required',
+    'client_management': 'Client contracts in various currencies',
+    'general_operations': 'Global operations with multi-currency support'
+})
+
+_REGION_FLAGS = MappingProxyType({
+    'north_america': '🇺🇸',
+    'europe': '🇪🇺',
+    'asia_pacific': '🌏'
+})
+
+@lru_cache(maxsize=1024)
+def _client_region(client_name: str) -> str:
+    """Region flag for a client name (client names repeat across result rows)"""
+    market = first_keyword_category(client_name.lower(), _CLIENT_REGION_CATEGORIES)
+    return _REGION_FLAGS.get(market, '') if market else ''
+
+# Query focus, checked in this order (financial before client)
+_QUERY_FOCUS_CATEGORIES = keyword_categories({
+    'financial_analysis': ('revenue', 'budget', 'usd'),
+    'client_management': ('client', 'customer'),
+})
+
 class InternationalPrompt(BaseCompanyPrompt):
     """🌍 FIXED International Prompt - Compatible with BaseCompanyPrompt"""
     
+    # 🌍 International data - class level, so it already exists while super().__init__() loads the rules
+    international_data = _INTERNATIONAL_DATA
+    
     def __init__(self, company_config: Dict[str, Any]):
         # 🔧 Initialize parent class first
         super().__init__(company_config)
         
-        # 🌍 International data - moved AFTER super().__init__()
-        self.international_data = {
-            'markets': {
-                'north_america': {
-                    'countries': ['USA', 'Canada'],
-                    'currency': 'USD',
-                    'clients': ['MegaCorp International']
-                },
-                'europe': {
-                    'countries': ['UK', 'Germany'],
-                    'currency': 'EUR/GBP',
-                    'clients': ['Education Global Network']
-                },
-                'asia_pacific': {
-                    'countries': ['Singapore', 'Australia'],
-                    'currency': 'SGD/AUD',
-                    'clients': ['Global Finance Corp']
-                }
-            },
-            'currencies': {
-                'primary': ['USD', 'EUR', 'GBP'],
-                'secondary': ['SGD', 'AUD'],
-                'rates': {'USD': 1.0, 'EUR': 0.85, 'GBP': 0.80}
-            },
-            'major_clients': [
-                'MegaCorp International (USA)',
-                'Education Global Network (UK)', 
-                'Global Finance Corp (Singapore)'
-            ],
-            'keywords': {
-                'financial': ['revenue', 'budget', 'usd', 'profit'],
-                'global': ['international', 'global', 'worldwide'],
-                'clients': ['client', 'customer', 'megacorp'],
-                'projects': ['project', 'platform', 'system']
-            }
+        # Canned answers: the greeting is fully static, the others only add the question
+        self._greeting_answer = f"""Hello! I'm the AI Assistant for {self.company_name}
+
+🌍 Global Software Solutions & Cross-border Operations
+
+Our International Expertise:
+• Multi-currency software platforms (USD, EUR, GBP, SGD, AUD)
+• Cross-border payment systems
+• Global compliance frameworks
+
+🌎 Market Coverage:
+• North America: USA, Canada
+• Europe: UK, Germany
+• Asia-Pacific: Singapore, Australia
+
+🏢 Major Clients:
+• MegaCorp International (USA) - $2.8M USD
+• Global Finance Corp (Singapore) - $3.2M USD
+
+How can I help you with our global operations today?"""
+        self._answer_heads = {
+            'financial': f"🌍 Global Financial Analysis - {self.company_name}\n\nQuery: ",
+            'global': f"🌎 Global Operations Overview - {self.company_name}\n\nQuery: ",
+            'general': f"🌍 {self.company_name} - Global Software Solutions\n\nQuestion: "
         }
         
-        logger.info(f"🌍 InternationalPrompt initialized for {self.company_name}")
+        # Company-invariant head of the SQL prompt, up to the query focus
+        self._sql_prompt_prefix = f"""You are an International Business Analyst for {self.company_name}
+
+🌍 Business Context: Global Software Solutions & Cross-border Operations
+💱 Currencies: USD (primary), EUR, GBP, SGD, AUD
+🌎 Markets: North America, Europe, Asia-Pacific
+🎯 Focus: """
+        
+        logger.info("🌍 InternationalPrompt initialized for %s", self.company_name)
     
     # ========================================================================
     # 🎯 REQUIRED METHODS from BaseCompanyPrompt
@@ -64,24 +213,27 @@ class InternationalPrompt(BaseCompanyPrompt):
         """🎯 Main processing method for international queries"""
         
         try:
-            self.usage_stats['queries_processed'] += 1
-            self.usage_stats['last_used'] = datetime.now().isoformat()
+            self._record_query()
+            
+            # Ordered checks pick the highest-priority category present
+            category = first_keyword_category(question.lower(), _QUESTION_CATEGORIES)
             
-            if self._is_greeting(question):
+            if category == 'greeting':
                 return self._create_international_greeting()
-            elif self._is_financial_query(question):
+            elif category == 'financial':
                 return self._create_financial_response(question)
-            elif self._is_global_query(question):
+            elif category == 'global':
                 return self._create_global_response(question)
             else:
                 return self._create_general_response(question)
                 
         except Exception as e:
-            logger.error(f"❌ International processing failed: {e}")
+            error = str(e)
+            logger.error("❌ International processing failed: %s", error)
             return {
                 'success': False,
-                'answer': f"System error: {str(e)}",
-                'error': str(e),
+                'answer': f"System error: {error}",
+                'error': error,
                 'tenant_id': self.company_id
             }
     
@@ -91,25 +243,9 @@ class InternationalPrompt(BaseCompanyPrompt):
         query_focus = self._detect_query_focus(question)
         currency_hint = self._get_currency_hint(query_focus)
         
-        prompt = f"""You are an International Business Analyst for {self.company_name}
-
-🌍 Business Context: Global Software Solutions & Cross-border Operations
-💱 Currencies: USD (primary), EUR, GBP, SGD, AUD
-🌎 Markets: North America, Europe, Asia-Pacific
-🎯 Focus: {query_focus}
-
-📊 Database Schema:
-• employees: id, name, department, position, salary, hire_date, email
-• projects: id, name, client, budget, status, start_date, end_date, tech_stack
-• employee_projects: employee_id, project_id, role, allocation
-
-💱 Currency Context: {currency_hint}
-
-Question: {question}
-
-Generate PostgreSQL query for international operations:"""
-
-        return prompt
+        return (self._sql_prompt_prefix + query_focus + _SQL_PROMPT_MID + currency_hint
+                + "\n\nQuestion: " + question
+                + "\n\nGenerate PostgreSQL query for international operations:")
     
     def format_response(self, question: str, results: List[Dict], metadata: Dict) -> str:
         """🎨 Format international business response"""
@@ -117,136 +253,62 @@ Generate PostgreSQL query for international operations:"""
         if not results:
             return f"No international data found for: {question}"
         
-        response = f"🌍 Global Business Analysis - {self.company_name}\n\n"
-        response += f"Query: {question}\n\n"
+        parts = [f"🌍 Global Business Analysis - {self.company_name}\n\n",
+                 f"Query: {question}\n\n"]
+        
+        # Result rows share their columns, so classify column names once
+        budget_columns = frozenset(key for key in results[0] if 'budget' in key.lower())
+        client_columns = frozenset(key for key in results[0] if 'client' in key.lower())
         
         for i, row in enumerate(results[:15], 1):
-            response += f"{i:2d}. "
+            row_parts = []
             for key, value in row.items():
-                if 'budget' in key.lower() and isinstance(value, (int, float)):
-                    response += f"{key}: ${value:,.0f} USD, "
-                elif 'client' in key.lower() and value:
+                # Values are still type-checked per cell: a budget may be NULL
+                if key in budget_columns and isinstance(value, (int, float)):
+                    row_parts.append(f"{key}: ${value:,.0f} USD")
+                elif key in client_columns and value:
                     region = self._get_client_region(value)
-                    response += f"{key}: {value} {region}, "
+                    row_parts.append(f"{key}: {value} {region}")
                 else:
-                    response += f"{key}: {value}, "
-            response = response.rstrip(', ') + "\n"
+                    row_parts.append(f"{key}: {value}")
+            parts.append((f"{i:2d}. " + ", ".join(row_parts)).rstrip(', ') + "\n")
         
-        response += f"\n💡 Global Operations: {len(results)} records found"
+        parts.append(f"\n💡 Global Operations: {len(results)} records found")
         
-        return response
+        return "".join(parts)
     
-    def _load_business_rules(self) -> Dict[str, Any]:
-        """📋 International business rules"""
-        return {
-            'focus': 'international_operations_multi_currency',
-            'primary_currency': 'USD',
-            'supported_currencies': list(self.international_data['currencies']['rates'].keys()),
-            'client_base': 'global_enterprise'
-        }
+    def _load_business_rules(self) -> Mapping[str, Any]:
+        """📋 International business rules (shared, read-only)"""
+        return _BUSINESS_RULES
     
-    def _load_schema_mappings(self) -> Dict[str, Any]:
-        """🗄️ International schema mappings"""
-        return {
-            'main_tables': ['employees', 'projects', 'employee_projects'],
-            'currency_fields': ['budget', 'salary'],
-            'international_keywords': self.international_data['keywords']
-        }
+    def _load_schema_mappings(self) -> Mapping[str, Any]:
+        """🗄️ International schema mappings (shared, read-only)"""
+        return _SCHEMA_MAPPINGS
     
     # ========================================================================
     # 🔧 HELPER METHODS
     # ========================================================================
     
-    def _is_greeting(self, question: str) -> bool:
-        greetings = ['hello', 'hi', 'help', 'who are you', 'สวัสดี']
-        return any(word in question.lower() for word in greetings)
-    
-    def _is_financial_query(self, question: str) -> bool:
-        return any(keyword in question.lower() 
-                  for keyword in self.international_data['keywords']['financial'])
-    
-    def _is_global_query(self, question: str) -> bool:
-        return any(keyword in question.lower()
-                  for keyword in self.international_data['keywords']['global'])
-    
     def _detect_query_focus(self, question: str) -> str:
-        question_lower = question.lower()
-        
-        if any(word in question_lower for word in ['revenue', 'budget', 'usd']):
-            return 'financial_analysis'
-        elif any(word in question_lower for word in ['client', 'customer']):
-            return 'client_management'
-        else:
-            return 'general_operations'
+        return first_keyword_category(question.lower(), _QUERY_FOCUS_CATEGORIES) or 'general_operations'
     
     def _get_currency_hint(self, query_focus: str) -> str:
-        hints = {
-            'financial_analysis': 'Multi-currency revenue analysis, USD conversion required',
-            'client_management': 'Client contracts in various currencies',
-            'general_operations': 'Global operations with multi-currency support'
-        }
-        return hints.get(query_focus, 'Multi-currency international operations')
+        return _CURRENCY_HINTS.get(query_focus, 'Multi-currency international operations')
     
     def _get_client_region(self, client_name: str) -> str:
-        client_lower = client_name.lower()
-        
-        for market, data in self.international_data['markets'].items():
-            for client in data['clients']:
-                if any(word in client_lower for word in client.lower().split()):
-                    region_names = {
-                        'north_america': '🇺🇸',
-                        'europe': '🇪🇺', 
-                        'asia_pacific': '🌏'
-                    }
-                    return region_names.get(market, '')
-        return ''
+        return _client_region(client_name)
     
     def _create_international_greeting(self) -> Dict[str, Any]:
-        answer = f"""Hello! I'm the AI Assistant for {self.company_name}
-
-🌍 Global Software Solutions & Cross-border Operations
-
-Our International Expertise:
-• Multi-currency software platforms (USD, EUR, GBP, SGD, AUD)
-• Cross-border payment systems
-• Global compliance frameworks
-
-🌎 Market Coverage:
-• North America: USA, Canada
-• Europe: UK, Germany
-• Asia-Pacific: Singapore, Australia
-
-🏢 Major Clients:
-• MegaCorp International (USA) - $2.8M USD
-• Global Finance Corp (Singapore) - $3.2M USD
-
-How can I help you with our global operations today?"""
-        
         return {
             'success': True,
-            'answer': answer,
+            'answer': self._greeting_answer,
             'sql_query': None,
             'data_source_used': f'international_greeting_{self.model}',
             'tenant_id': self.company_id
         }
     
     def _create_financial_response(self, question: str) -> Dict[str, Any]:
-        answer = f"""🌍 Global Financial Analysis - {self.company_name}
-
-Query: {question}
-
-💰 Multi-Currency Revenue Portfolio:
-
-1. Global E-commerce Platform - MegaCorp International 🇺🇸
-   • Contract Value: $2,800,000 USD
-   • Status: Active
-
-2. International Banking API - Global Finance Corp 🌏
-   • Contract Value: $3,200,000 USD
-
-💱 Currency Breakdown:
-• USD Revenue: $6,000,000+ (direct + converted)
-• Active Currencies: USD, GBP, SGD, AUD"""
+        answer = self._answer_heads['financial'] + question + _FINANCIAL_ANSWER_TAIL
         
         return {
             'success': True,
@@ -257,23 +319,7 @@ Query: {question}
         }
     
     def _create_global_response(self, question: str) -> Dict[str, Any]:
-        answer = f"""🌎 Global Operations Overview - {self.company_name}
-
-Query: {question}
-
-🌍 International Project Portfolio:
-
-1. Cross-border Payment System 🇦🇺
-   • Budget: $1,800,000 USD
-   • Status: Completed
-
-2. Global Compliance Platform 🇩🇪
-   • Budget: $3,850,000 USD
-   • Status: In Development
-
-🌐 Global Infrastructure:
-• Time Zone Coverage: 24/7 operations
-• Team Distribution: 8 international developers"""
+        answer = self._answer_heads['global'] + question + _GLOBAL_ANSWER_TAIL
         
         return {
             'success': True,
@@ -284,23 +330,7 @@ Query: {question}
         }
     
     def _create_general_response(self, question: str) -> Dict[str, Any]:
-        answer = f"""🌍 {self.company_name} - Global Software Solutions
-
-Question: {question}
-
-Our International Capabilities:
-• Cross-border software development
-• Multi-currency system architecture
-• Global compliance and security
-
-🌎 Geographic Presence:
-• Development Teams: Bangkok (HQ), Remote Global
-• Client Base: USA, UK, Singapore, Australia
-
-💡 Ask me about:
-• International project portfolios
-• Multi-currency revenue analysis  
-• Global client relationships"""
+        answer = self._answer_heads['general'] + question + _GENERAL_ANSWER_TAIL
         
         return {
             'success': True,
@@ -308,4 +338,4 @@ Our International Capabilities:
             'sql_query': None,
             'data_source_used': f'international_general_{self.model}',
             'tenant_id': self.company_id
-        }
\ No newline at end of file
+        }
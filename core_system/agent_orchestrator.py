@@ -1,6 +1,8 @@
 import asyncio
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
 
 from .prompt_manager import PromptManager
@@ -32,7 +34,7 @@ class AgentOrchestrator:
             'successful_queries': 0,
             'failed_queries': 0,
             'avg_response_time': 0,
-            'company_breakdown': {}
+            'company_breakdown': defaultdict(lambda: {'queries': 0, 'successes': 0, 'failures': 0})
         }
         
         logger.info("🎭 AgentOrchestrator initialized with modular architecture")
@@ -40,7 +42,7 @@ class AgentOrchestrator:
     async def process_query(self, question: str, tenant_id: str) -> Dict[str, Any]:
         """🎯 Main entry point for processing queries"""
         
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             # 1. Validate tenant
@@ -72,13 +74,13 @@ class AgentOrchestrator:
             formatted_response = self.prompt_manager.format_response(
                 tenant_id, question, results, {
                     'sql_query': sql_query,
-                    'execution_time': (datetime.now() - start_time).total_seconds(),
+                    'execution_time': (time.perf_counter_ns() - start_ns) / 1e9,
                     'results_count': len(results)
                 }
             )
             
             # 8. Update statistics
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             self._update_statistics(tenant_id, True, processing_time)
             
             return {
@@ -94,7 +96,7 @@ class AgentOrchestrator:
             
         except Exception as e:
             # Handle errors gracefully
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             self._update_statistics(tenant_id, False, processing_time)
             
             logger.error(f"❌ Query processing failed for {tenant_id}: {e}")
@@ -111,25 +113,19 @@ class AgentOrchestrator:
     def _update_statistics(self, tenant_id: str, success: bool, processing_time: float):
         """📊 Update system statistics"""
         
-        self.system_stats['total_queries'] += 1
+        stats = self.system_stats
+        stats['total_queries'] += 1
         
         if success:
-            self.system_stats['successful_queries'] += 1
+            stats['successful_queries'] += 1
         else:
-            self.system_stats['failed_queries'] += 1
+            stats['failed_queries'] += 1
         
-        # Update average response time
-        total_time = (self.system_stats['avg_response_time'] * 
-                     (self.system_stats['total_queries'] - 1) + processing_time)
-        self.system_stats['avg_response_time'] = total_time / self.system_stats['total_queries']
+        # Update average response time (running mean, no total to rebuild)
+        stats['avg_response_time'] += (processing_time - stats['avg_response_time']) / stats['total_queries']
         
-        # Update company breakdown
-        if tenant_id not in self.system_stats['company_breakdown']:
-            self.system_stats['company_breakdown'][tenant_id] = {
-                'queries': 0, 'successes': 0, 'failures': 0
-            }
-        
-        company_stats = self.system_stats['company_breakdown'][tenant_id]
+        # Update company breakdown (entries are created on first use)
+        company_stats = stats['company_breakdown'][tenant_id]
         company_stats['queries'] += 1
         
         if success:
@@ -155,7 +151,7 @@ class AgentOrchestrator:
                 'avg_response_time': round(self.system_stats['avg_response_time'], 3),
                 'active_companies': len(prompt_stats['active_prompts'])
             },
-            'company_breakdown': self.system_stats['company_breakdown'],
+            'company_breakdown': dict(self.system_stats['company_breakdown']),
             'prompt_statistics': prompt_stats,
             'system_health': 'healthy' if success_rate > 80 else 'needs_attention',
             'last_updated': datetime.now().isoformat()
@@ -181,30 +177,43 @@ class AgentOrchestrator:
             health_status['components']['prompt_manager'] = {'status': 'error', 'error': str(e)}
             health_status['issues'].append(f"Prompt Manager: {str(e)}")
         
+        # Database and AI probes are independent, so run them concurrently
+        (db_status, db_issue), (ai_status, ai_issue) = await asyncio.gather(
+            self._run_health_probe(
+                self.database_manager, "Database Manager",
+                lambda status: status.get('all_databases_connected', False),
+                "Some databases not connected"
+            ),
+            self._run_health_probe(
+                self.ai_service, "AI Service",
+                lambda status: status.get('status') == 'healthy',
+                "AI Service not responding"
+            )
+        )
+        
         # Check database manager
-        try:
-            db_status = await self.database_manager.health_check()
-            health_status['components']['database_manager'] = db_status
-            
-            if not db_status.get('all_databases_connected', False):
-                health_status['issues'].append("Some databases not connected")
-        except Exception as e:
-            health_status['components']['database_manager'] = {'status': 'error', 'error': str(e)}
-            health_status['issues'].append(f"Database Manager: {str(e)}")
+        health_status['components']['database_manager'] = db_status
+        if db_issue is not None:
+            health_status['issues'].append(db_issue)
         
         # Check AI service
-        try:
-            ai_status = await self.ai_service.health_check()
-            health_status['components']['ai_service'] = ai_status
-            
-            if ai_status.get('status') != 'healthy':
-                health_status['issues'].append("AI Service not responding")
-        except Exception as e:
-            health_status['components']['ai_service'] = {'status': 'error', 'error': str(e)}
-            health_status['issues'].append(f"AI Service: {str(e)}")
+        health_status['components']['ai_service'] = ai_status
+        if ai_issue is not None:
+            health_status['issues'].append(ai_issue)
         
         # Overall status determination
         if len(health_status['issues']) > 0:
             health_status['overall_status'] = 'degraded' if len(health_status['issues']) < 3 else 'unhealthy'
         
-        return health_status
\ No newline at end of file
+        return health_status
+    
+    async def _run_health_probe(self, component: Any, name: str,
+                                is_healthy: Callable[[Dict[str, Any]], bool],
+                                unhealthy_issue: str) -> Tuple[Dict[str, Any], Optional[str]]:
+        """🩺 Run one component health check and its status test; failures come back as an error status, never raised"""
+        
+        try:
+            status = await component.health_check()
+            return status, None if is_healthy(status) else unhealthy_issue
+        except Exception as e:
+            return {'status': 'error', 'error': str(e)}, f"{name}: {str(e)}"
\ No newline at end of file